@@ -3,43 +3,42 @@ from __future__ import annotations
 import io
 
 import streamlit as st
-from agent.tools import FinanceData, respond, revenue_vs_budget_usd, opex_breakdown_usd, cash_runway_now, plot_revenue_vs_budget_bar, plot_opex_breakdown_bar, plot_cash_trend
-import matplotlib.pyplot as plt
-from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+from agent.tools import FinanceData, respond, release_fig
 
-def generate_pdf(fin: FinanceData, out_path: str = "export.pdf", answer_text: str | None = None, answer_img_bytes: bytes | None = None) -> str:
-    """Generate a tiny PDF with a couple of KPIs and charts.
+def _save_png_fast(fig, buf) -> None:
+    """Write `fig` into `buf` as PNG, favouring encode speed over file size.
 
-    If `answer_text` or `answer_img_bytes` are provided, include a page
-    with the latest Q&A output (text and optional chart image).
+    Charts are mostly flat colour, so zlib level 1 barely grows the output
+    while skipping most of the deflate work; the Software tEXt chunk is dropped.
+    `tight_layout` trims margins up front, avoiding the extra measuring render
+    that `bbox_inches='tight'` does.
     """
-    # Choose latest month for point-in-time views
-    latest = sorted(fin.actuals["month"].unique())[-1]
-    rvb = revenue_vs_budget_usd(fin, latest)
-    opex = opex_breakdown_usd(fin, latest)
-
-    # Create charts to embed
-    fig1 = plot_revenue_vs_budget_bar(rvb['actual_usd'], rvb['budget_usd'], title=f"Revenue vs Budget — {latest}")
-    img1 = io.BytesIO()
-    fig1.savefig(img1, format='png', bbox_inches='tight', dpi=180)
-    plt.close(fig1)
-
-    fig2 = plot_opex_breakdown_bar(opex, title=f"Opex Breakdown — {latest}")
-    img2 = io.BytesIO()
-    fig2.savefig(img2, format='png', bbox_inches='tight', dpi=180)
-    plt.close(fig2)
-
-    fig3 = plot_cash_trend(fin, months=6, title="Cash Trend — last 6 months")
-    img3 = io.BytesIO()
-    fig3.savefig(img3, format='png', bbox_inches='tight', dpi=180)
-    plt.close(fig3)
-
-    img1.seek(0); img2.seek(0); img3.seek(0)
+    fig.tight_layout(pad=0.2)
+    fig.savefig(
+        buf,
+        format='png',
+        dpi=180,
+        metadata={'Software': None},
+        pil_kwargs={'compress_level': 1, 'optimize': False},
+    )
+
+def generate_pdf(fin: FinanceData, out_path: str | None = "export.pdf", answer_text: str | None = None, answer_img_bytes: bytes | None = None) -> str | bytes:
+    """Generate a one-page PDF with the latest Q&A output.
+
+    If `answer_text` or `answer_img_bytes` are provided, the page holds the
+    answer text and optional chart image; otherwise the PDF is left blank.
+
+    With `out_path=None` the PDF is built in memory and its bytes returned
+    instead of a file path.
+    """
+    # reportlab is only needed on Export, so keep it off the rerun import path
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.utils import ImageReader
 
     # Write PDF
-    c = canvas.Canvas(out_path, pagesize=LETTER)
+    buf = io.BytesIO() if out_path is None else None
+    c = canvas.Canvas(buf if buf is not None else out_path, pagesize=LETTER)
     width, height = LETTER
 
     if answer_text or answer_img_bytes:
@@ -65,15 +64,35 @@ def generate_pdf(fin: FinanceData, out_path: str = "export.pdf", answer_text: st
         # If an image was provided (bytes), embed it below the text
         if answer_img_bytes:
             try:
-                img_buf = io.BytesIO(answer_img_bytes)
-                img_buf.seek(0)
-                c.drawImage(ImageReader(img_buf), 40, 120, width=500, preserveAspectRatio=True, mask='auto')
+                # The chart arrives as PNG bytes cached on an earlier rerun; no
+                # live Figure exists here, so wrap the bytes for reportlab as-is.
+                c.drawImage(ImageReader(io.BytesIO(answer_img_bytes)), 40, 120, width=500, preserveAspectRatio=True, mask='auto')
             except Exception:
                 # If embedding fails, continue without breaking PDF generation
                 pass
 
     c.save()
-    return out_path
+    return buf.getvalue() if buf is not None else out_path
+
+@st.cache_resource(show_spinner=False)
+def _load_fin(path: str) -> FinanceData:
+    """Load the fixtures once per process; Streamlit reruns reuse the object."""
+    return FinanceData.from_dir(path)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _respond_cached(q: str, _fin: FinanceData, fin_id: int) -> tuple[str, bytes | None]:
+    """Answer `q` and return the chart as PNG bytes.
+
+    `_fin` is skipped by Streamlit's hasher; `fin_id` (stable because the data
+    comes from `_load_fin`) keys the cache instead.
+    """
+    text, fig = respond(q, _fin)
+    if fig is None:
+        return text, None
+    buf = io.BytesIO()
+    _save_png_fast(fig, buf)
+    release_fig(fig)
+    return text, buf.getvalue()
 
 def app_ui():
     st.set_page_config(page_title="Mini CFO Copilot", layout="wide")
@@ -92,7 +111,7 @@ What is our cash runway right now?
     if 'show_download' not in st.session_state:
         st.session_state['show_download'] = False
 
-    fin = FinanceData.from_dir('fixtures')
+    fin = _load_fin('fixtures')
 
     # Initialize session state for storing last Q&A so export can capture it
     if 'last_answer_text' not in st.session_state:
@@ -100,41 +119,42 @@ What is our cash runway right now?
     if 'last_answer_img' not in st.session_state:
         st.session_state['last_answer_img'] = None
 
-    if not st.session_state['show_download']:
-        if st.button("Export PDF (2 pages)"):
-            # Generate PDF and set state to show download button
-            path = generate_pdf(
-                fin,
-                out_path="export.pdf",
-                answer_text=st.session_state.get('last_answer_text'),
-                answer_img_bytes=st.session_state.get('last_answer_img'),
-            )
-            st.session_state['show_download'] = True
-            st.rerun()
-    else:
-        with open("export.pdf", "rb") as f:
-            if st.download_button("Download export.pdf", data=f, file_name="export.pdf", mime="application/pdf"):
-                st.session_state['show_download'] = False
-                st.rerun()
-
-    q = st.text_input("Ask a question", value="What was June 2025 revenue vs budget in USD?")
-    ask = st.button("Ask" , type="primary")
+    # A form only reruns the script on submit, not on every edit of the input.
+    with st.form('ask_form', clear_on_submit=False):
+        q = st.text_input("Ask a question", value="What was June 2025 revenue vs budget in USD?")
+        ask = st.form_submit_button("Ask", type="primary")
 
     if ask and q.strip():
         with st.spinner("Thinking..."):
-            text, fig = respond(q, fin)
+            text, img = _respond_cached(q, fin, id(fin))
         st.markdown(f"**Answer**\n\n{text}")
         # Save the latest answer into session_state so Export can include it.
         st.session_state['last_answer_text'] = text
-        if fig is not None:
-            # Save figure as PNG bytes for embedding into PDF later
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight', dpi=180)
-            buf.seek(0)
-            st.session_state['last_answer_img'] = buf.getvalue()
-            st.pyplot(fig, clear_figure=True)
+        st.session_state['last_answer_img'] = img
+        if img is not None:
+            st.image(img)
+
+    # Export is drawn after the Ask handling so it appears as soon as there is
+    # an answer to export, and is skipped entirely until then.
+    if not st.session_state.get('last_answer_text'):
+        return
+    with st.sidebar:
+        if not st.session_state['show_download']:
+            if st.button("Export PDF"):
+                # Generate PDF in memory and set state to show download button
+                st.session_state['export_pdf'] = generate_pdf(
+                    fin,
+                    out_path=None,
+                    answer_text=st.session_state.get('last_answer_text'),
+                    answer_img_bytes=st.session_state.get('last_answer_img'),
+                )
+                st.session_state['show_download'] = True
+                st.rerun()
         else:
-            st.session_state['last_answer_img'] = None
+            if st.download_button("Download export.pdf", data=st.session_state['export_pdf'], file_name="export.pdf", mime="application/pdf"):
+                st.session_state['show_download'] = False
+                st.session_state['export_pdf'] = None
+                st.rerun()
 
 if __name__ == "__main__":
     app_ui()
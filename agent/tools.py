@@ -1,75 +1,265 @@
 from __future__ import annotations
 
+import datetime
+import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from dateutil import parser as dateparser
-import matplotlib.pyplot as plt
+from pandas.api.types import union_categoricals
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 # -----------------------------
 # Data Loading & Utilities
 # -----------------------------
 
-@dataclass
+# pyarrow's multithreaded CSV reader is much faster on cold loads, and it
+# also enables reading Parquet copies of the fixtures; it is optional, so
+# fall back to pandas' C parser when it isn't installed.
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+_CSV_ENGINE = "pyarrow" if _HAS_PYARROW else "c"
+
+_LEDGER_DTYPES = {"month": str, "entity": str, "account_category": str, "amount": "float64", "currency": str}
+TABLE_DTYPES = {
+    "actuals": _LEDGER_DTYPES,
+    "budget": _LEDGER_DTYPES,
+    "fx": {"month": str, "currency": str, "rate_to_usd": "float64"},
+    "cash": {"month": str, "entity": str, "cash_usd": "float64"},
+}
+
+def _read_table(path: str, name: str) -> pd.DataFrame:
+    """Read `<path>/<name>`, preferring a Parquet copy that is newer than the CSV.
+
+    Parquet copies come from `python -m scripts.convert_fixtures`; a CSV edited after
+    the conversion wins, so a stale copy is never used.
+    """
+    csv_path = os.path.join(path, f"{name}.csv")
+    parquet_path = os.path.join(path, f"{name}.parquet")
+    if _HAS_PYARROW and os.path.exists(parquet_path) and (
+        not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+    ):
+        return pd.read_parquet(parquet_path, engine="pyarrow")
+    # Explicit dtypes skip inference and keep month as a string.
+    return pd.read_csv(csv_path, engine=_CSV_ENGINE, dtype=TABLE_DTYPES[name])
+
+# Frozen so the precomputed tables can't drift from the inputs; eq=False keeps
+# hashing by identity, which makes an instance usable as a cache key.
+@dataclass(frozen=True, eq=False)
 class FinanceData:
     actuals: pd.DataFrame
     budget: pd.DataFrame
     fx: pd.DataFrame
     cash: pd.DataFrame
 
+    # Derived once from the inputs above; metrics read these instead of
+    # re-joining against FX on every call.
+    actuals_usd: pd.DataFrame = field(init=False, repr=False)
+    budget_usd: pd.DataFrame = field(init=False, repr=False)
+    opex_rows: pd.DataFrame = field(init=False, repr=False)
+    pivot_usd: pd.DataFrame = field(init=False, repr=False)
+    budget_pivot_usd: pd.DataFrame = field(init=False, repr=False)
+    ebitda_by_month_df: pd.DataFrame = field(init=False, repr=False)
+    month_dtype: pd.CategoricalDtype = field(init=False, repr=False)
+    sorted_months: np.ndarray = field(init=False, repr=False)
+    sorted_cash_months: np.ndarray = field(init=False, repr=False)
+    cash_sorted: pd.DataFrame = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # One shared, ordered set of month categories across all tables, so
+        # month filters, sorts and the FX join work on integer codes instead of
+        # strings. YYYY-MM sorts chronologically, so code order is time order.
+        months = union_categoricals(
+            [pd.Categorical(df["month"].astype(str)) for df in (self.actuals, self.budget, self.fx, self.cash)],
+            sort_categories=True,
+        ).categories
+        month_dtype = pd.CategoricalDtype(months, ordered=True)
+        # Currency likewise, so the FX rate lookup matches on codes.
+        currencies = union_categoricals(
+            [pd.Categorical(df["currency"].astype(str)) for df in (self.actuals, self.budget, self.fx)],
+            sort_categories=True,
+        ).categories
+        currency_dtype = pd.CategoricalDtype(currencies)
+        # And account_category, shared by actuals and budget, for the groupbys.
+        categories = union_categoricals(
+            [pd.Categorical(df["account_category"].astype(str)) for df in (self.actuals, self.budget)],
+            sort_categories=True,
+        ).categories
+        category_dtype = pd.CategoricalDtype(categories)
+        actuals = self.actuals.assign(
+            month=self.actuals["month"].astype(str).astype(month_dtype),
+            account_category=self.actuals["account_category"].astype(str).astype(category_dtype),
+            currency=self.actuals["currency"].astype(str).astype(currency_dtype),
+            amount=_float64_column(self.actuals["amount"]),
+        )
+        budget = self.budget.assign(
+            month=self.budget["month"].astype(str).astype(month_dtype),
+            account_category=self.budget["account_category"].astype(str).astype(category_dtype),
+            currency=self.budget["currency"].astype(str).astype(currency_dtype),
+            amount=_float64_column(self.budget["amount"]),
+        )
+        fx = self.fx.assign(
+            month=self.fx["month"].astype(str).astype(month_dtype),
+            currency=self.fx["currency"].astype(str).astype(currency_dtype),
+            rate_to_usd=_float64_column(self.fx["rate_to_usd"]),
+        )
+        cash = self.cash.assign(
+            month=self.cash["month"].astype(str).astype(month_dtype),
+            cash_usd=_float64_column(self.cash["cash_usd"]),
+        )
+
+        # Index the FX table once for both conversions.
+        rates = _fx_rates(fx)
+        actuals_usd = _with_usd(actuals, rates)
+        budget_usd = _with_usd(budget, rates)
+
+        # Month x account_category USD totals; every P&L metric is a slice of these.
+        pivot_usd = _monthly_pivot(actuals_usd)
+        budget_pivot_usd = _monthly_pivot(budget_usd)
+
+        # The instance is frozen, so fields are set through object.__setattr__.
+        derived = {
+            "actuals": actuals,
+            "budget": budget,
+            "fx": fx,
+            "cash": cash,
+            "month_dtype": month_dtype,
+            "sorted_months": _observed_months(actuals["month"]),
+            "sorted_cash_months": _observed_months(cash["month"]),
+            # Stable, so rows within a month keep their file order
+            "cash_sorted": cash.sort_values("month", kind="stable").reset_index(drop=True),
+            "actuals_usd": actuals_usd,
+            "budget_usd": budget_usd,
+            "opex_rows": actuals_usd[actuals_usd["account_category"].str.startswith("Opex:", na=False)],
+            "pivot_usd": pivot_usd,
+            "budget_pivot_usd": budget_pivot_usd,
+            "ebitda_by_month_df": _ebitda_table(actuals_usd),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
     @classmethod
     def from_dir(cls, path: str = "fixtures") -> "FinanceData":
-        actuals = pd.read_csv(f"{path}/actuals.csv")
-        budget  = pd.read_csv(f"{path}/budget.csv")
-        fx      = pd.read_csv(f"{path}/fx.csv")
-        cash    = pd.read_csv(f"{path}/cash.csv")
+        # The four reads are independent and the parsers release the GIL,
+        # so load them concurrently: wall time is the slowest file, not the sum.
+        with ThreadPoolExecutor(max_workers=len(TABLE_DTYPES)) as ex:
+            futures = {name: ex.submit(_read_table, path, name) for name in TABLE_DTYPES}
+            tables = {name: f.result() for name, f in futures.items()}
+
+        return cls(**tables)
+
+def _float64_column(col: pd.Series) -> np.ndarray:
+    """`col` as a C-contiguous float64 array (no copy when it already is one)."""
+    return np.ascontiguousarray(col.to_numpy(dtype=np.float64))
+
+def _observed_months(month: pd.Series) -> np.ndarray:
+    """Months that occur in an ordered-categorical `month` column, oldest first."""
+    codes = month.cat.codes.to_numpy()
+    return month.cat.categories[np.unique(codes[codes >= 0])].to_numpy(dtype=object)
+
+def _monthly_pivot(rows: pd.DataFrame) -> pd.DataFrame:
+    """USD totals with one row per month and one column per account_category."""
+    pt = rows.groupby(["month", "account_category"], observed=True)["usd"].sum().unstack(fill_value=0.0)
+    pt.index = pt.index.astype(str)
+    pt.columns = pt.columns.astype(str)
+    return pt
 
-        # Normalize types
-        for df in (actuals, budget, fx, cash):
-            df["month"] = df["month"].astype(str)
+def _fx_rates(fx: pd.DataFrame) -> pd.Series:
+    """`rate_to_usd` indexed by (month, currency)."""
+    return fx.set_index(["month", "currency"])["rate_to_usd"]
 
-        return cls(actuals=actuals, budget=budget, fx=fx, cash=cash)
+def _to_usd_arrays(month, currency, amount, rates: pd.Series) -> np.ndarray:
+    """USD amounts for parallel month/currency/amount arrays; missing rates give NaN."""
+    keys = pd.MultiIndex.from_arrays([month, currency])
+    return np.asarray(amount, dtype=np.float64) * rates.reindex(keys).to_numpy()
 
-def to_usd(df: pd.DataFrame, fx: pd.DataFrame) -> pd.DataFrame:
-    """Attach USD amounts using FX by month + currency."""
+def _with_usd(df: pd.DataFrame, rates: pd.Series) -> pd.DataFrame:
     if df.empty:
-        out = df.copy()
-        out["usd"] = 0.0
-        return out
-    merged = df.merge(fx, how="left", on=["month", "currency"])
-    merged["usd"] = merged["amount"] * merged["rate_to_usd"]
-    return merged
+        return df.assign(usd=0.0)
+    return df.assign(usd=_to_usd_arrays(df["month"].array, df["currency"].array, df["amount"].to_numpy(), rates))
 
-def month_str(dt_like: str | pd.Timestamp) -> str:
-    """Return YYYY-MM."""
-    if isinstance(dt_like, pd.Timestamp):
-        return dt_like.strftime("%Y-%m")
+def to_usd(df: pd.DataFrame, fx: pd.DataFrame) -> pd.DataFrame:
+    """Attach USD amounts using FX by month + currency.
+
+    Rates are gathered with a (month, currency) index lookup rather than a
+    merge, so no joined frame is built; missing rates give NaN.
+    """
+    return _with_usd(df, _fx_rates(fx))
+
+# Exactly "2025-06" / "2025-6" / "2025 06" / "2025-06-15", or "June 2025" / "jun 2025"
+_MONTH_RE = re.compile(
+    r"(?P<y>\d{4})[-\s](?P<m>\d{1,2})(?:-(?P<d>\d{1,2}))?"
+    r"|(?P<name>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?"
+    r"|aug(?:ust)?|sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\s+(?P<y2>\d{4})",
+    re.IGNORECASE,
+)
+
+def _month_str_from_text(dt_like) -> str:
     s = str(dt_like)
-    # accept YYYY-MM or any parseable date
-    if re.fullmatch(r"\d{4}-\d{2}", s):
-        return s
+    # Common shapes resolve with one regex match; anything else goes to dateutil
+    # The whole string must match, so trailing junk is never silently dropped
+    m = _MONTH_RE.fullmatch(s)
+    if m:
+        if m["name"]:
+            return f"{m['y2']}-{_MONTH_NUM[m['name'][:3].lower()]}"
+        try:
+            # Validates the month, and the day when one is given (2025-6-31 is not a date)
+            datetime.date(int(m["y"]), int(m["m"]), int(m["d"] or 1))
+            return f"{m['y']}-{int(m['m']):02d}"
+        except ValueError:
+            pass
+    # dateutil is only needed for free-form dates, so import it lazily
+    from dateutil import parser as dateparser
     try:
         d = dateparser.parse(s)
         return f"{d.year:04d}-{d.month:02d}"
     except Exception:
         return s  # fallback
 
+# Exact-type dispatch: one dict probe instead of an isinstance chain.
+# Unlisted types (datetime, str subclasses, ...) go through their text form.
+_MONTH_STR_DISPATCH = {
+    str: _month_str_from_text,
+    pd.Timestamp: lambda t: t.strftime("%Y-%m"),
+    np.datetime64: lambda t: np.datetime_as_string(t, unit="M"),
+}
+
+def month_str(dt_like: str | pd.Timestamp) -> str:
+    """Return YYYY-MM."""
+    return _MONTH_STR_DISPATCH.get(type(dt_like), _month_str_from_text)(dt_like)
+
 def latest_month(all_months: List[str]) -> str:
-    return sorted(all_months)[-1]
+    # YYYY-MM strings order lexicographically, so max() needs no sort or parsing
+    return max(all_months)
 
 # -----------------------------
 # Metrics
 # -----------------------------
 
+# Empty results, built once; functions hand out copies.
+_EMPTY_OPEX = pd.DataFrame({"account_category": pd.Series(dtype="object"), "usd": pd.Series(dtype="float64")})
+_EMPTY_EBITDA = pd.DataFrame({
+    "month": pd.Series(dtype="object"),
+    **{c: pd.Series(dtype="float64") for c in ("EBITDA", "Opex_total", "Revenue", "COGS")},
+})
+
+def _pivot_value(pt: pd.DataFrame, month: str, column: str) -> float:
+    """One cell of a monthly pivot; 0.0 when the month or column is absent."""
+    if month in pt.index and column in pt.columns:
+        return float(pt.at[month, column])
+    return 0.0
+
 def revenue_vs_budget_usd(fin: FinanceData, month: str) -> Dict[str, float]:
     m = month_str(month)
-    a = fin.actuals[(fin.actuals["month"] == m) & (fin.actuals["account_category"] == "Revenue")].copy()
-    b = fin.budget[(fin.budget["month"] == m) & (fin.budget["account_category"] == "Revenue")].copy()
-    a_usd = to_usd(a, fin.fx)["usd"].sum()
-    b_usd = to_usd(b, fin.fx)["usd"].sum()
+    a_usd = _pivot_value(fin.pivot_usd, m, "Revenue")
+    b_usd = _pivot_value(fin.budget_pivot_usd, m, "Revenue")
     return {
         "month": m,
         "actual_usd": float(a_usd),
@@ -79,59 +269,76 @@ def revenue_vs_budget_usd(fin: FinanceData, month: str) -> Dict[str, float]:
     }
 
 def gross_margin_pct_trend(fin: FinanceData, months: List[str]) -> pd.DataFrame:
-    a = to_usd(fin.actuals[fin.actuals["month"].isin(months)], fin.fx)
-    pt = (
-        a.pivot_table(index="month", columns="account_category", values="usd", aggfunc="sum")
-        .fillna(0.0)
-    )
-    rev = pt.get("Revenue", pd.Series(0.0, index=months))
-    cogs = pt.get("COGS", pd.Series(0.0, index=months))
-    if isinstance(rev, float):
-        rev = pd.Series(rev, index=months)
-    if isinstance(cogs, float):
-        cogs = pd.Series(cogs, index=months)
-    gm_pct = (rev - cogs) / rev.replace(0, np.nan)
-    out = pd.DataFrame({"month": gm_pct.index, "gm_pct": gm_pct.values})
-    out = out.sort_values("month")
+    # Vectorized over the monthly pivot; months absent from the data come
+    # back as NaN rows.
+    pt = fin.pivot_usd.reindex(columns=["Revenue", "COGS"], fill_value=0.0)
+    gm_pct = (pt["Revenue"] - pt["COGS"]) / pt["Revenue"].replace(0, np.nan)
+    out = gm_pct.reindex(months).rename("gm_pct").rename_axis("month").reset_index()
+    out = out.sort_values("month").reset_index(drop=True)
     return out
 
 def opex_breakdown_usd(fin: FinanceData, month: str) -> pd.DataFrame:
     m = month_str(month)
-    a = fin.actuals[(fin.actuals["month"] == m) & (fin.actuals["account_category"].str.startswith("Opex:"))].copy()
+    a = fin.opex_rows[fin.opex_rows["month"] == m]
     if a.empty:
-        return pd.DataFrame({"account_category": [], "usd": []})
-    usd = to_usd(a, fin.fx)
-    out = usd.groupby("account_category")["usd"].sum().sort_values(ascending=False).reset_index()
+        return _EMPTY_OPEX.copy()
+    out = a.groupby("account_category", observed=True)["usd"].sum().sort_values(ascending=False).reset_index()
+    out["account_category"] = out["account_category"].astype(str)
     return out
 
+def _ebitda_table(rows: pd.DataFrame) -> pd.DataFrame:
+    """Revenue, COGS, Opex total and EBITDA per month from USD actuals.
+
+    One scatter-add (`np.bincount`) over month/bucket codes fills a
+    (months x 3) table directly, with no intermediate pivot.
+    """
+    if rows.empty:
+        return _EMPTY_EBITDA.copy()
+
+    month = rows["month"].cat
+    category = rows["account_category"].cat
+    # Bucket per category: 0 = Revenue, 1 = COGS, 2 = Opex, -1 = not in EBITDA
+    names = category.categories.astype(str)
+    buckets = np.select([names == "Revenue", names == "COGS", names.str.startswith("Opex:")], [0, 1, 2], -1)
+    month_codes = month.codes.to_numpy()
+    category_codes = category.codes.to_numpy()
+    bucket = np.where(category_codes >= 0, buckets[category_codes], -1)
+
+    keep = (bucket >= 0) & (month_codes >= 0)
+    n_months = len(month.categories)
+    usd = np.nan_to_num(rows["usd"].to_numpy(dtype=np.float64))  # missing FX counts as 0, like .sum()
+    totals = np.bincount(
+        month_codes[keep] * 3 + bucket[keep], weights=usd[keep], minlength=n_months * 3
+    ).reshape(n_months, 3)
+
+    # Only months that actually have actuals rows
+    present = np.bincount(month_codes[month_codes >= 0], minlength=n_months) > 0
+    revenue, cogs, opex = totals[present].T
+    return pd.DataFrame({
+        "month": month.categories[present].astype(str),
+        "EBITDA": revenue - cogs - opex,
+        "Opex_total": opex,
+        "Revenue": revenue,
+        "COGS": cogs,
+    })
+
 def ebitda_by_month(fin: FinanceData) -> pd.DataFrame:
-    a = to_usd(fin.actuals, fin.fx)
-    if a.empty:
-        return pd.DataFrame(columns=["month", "EBITDA", "Opex_total", "Revenue", "COGS"])
-        
-    pt = (
-        a.pivot_table(index="month", columns="account_category", values="usd", aggfunc="sum")
-        .fillna(0.0)
-    )
-    opex_cols = [c for c in pt.columns if str(c).startswith("Opex:")]
-    pt["Opex_total"] = pt[opex_cols].sum(axis=1) if opex_cols else 0.0
-    pt["Revenue"] = pt.get("Revenue", 0.0)
-    pt["COGS"] = pt.get("COGS", 0.0)
-    pt["EBITDA"] = pt["Revenue"] - pt["COGS"] - pt["Opex_total"]
-    pt = pt[["EBITDA", "Opex_total", "Revenue", "COGS"]].reset_index()
-    pt = pt.sort_values("month")
-    return pt
+    # Copy so callers can't mutate the memoized table.
+    return fin.ebitda_by_month_df.copy()
 
 def cash_runway_now(fin: FinanceData) -> Dict[str, float | str]:
-    latest = latest_month(list(fin.cash["month"].unique()))
-    cash_row = fin.cash[fin.cash["month"] == latest]["cash_usd"]
-    cash_usd = float(cash_row.iloc[0]) if not cash_row.empty else np.nan
-
-    e = ebitda_by_month(fin).set_index("month")
-    last3 = sorted(fin.actuals["month"].unique())[-3:]
-    e3 = e.loc[last3, "EBITDA"]
-    net_burn = np.maximum(0.0, -e3.values)  # only count burn (loss)
-    avg_burn = float(np.mean(net_burn))
+    # Both tables are month-sorted, so "latest" and "last 3" come from plain
+    # arrays; no frames are copied or re-indexed. A month can hold several
+    # cash rows, so take the first row of the latest month (the stable sort
+    # keeps file order), as before.
+    latest = fin.sorted_cash_months[-1]
+    cash_months = fin.cash_sorted["month"].cat.codes.to_numpy()
+    first_latest = np.searchsorted(cash_months, fin.month_dtype.categories.get_loc(latest))
+    cash_usd = float(fin.cash_sorted["cash_usd"].to_numpy()[first_latest])
+
+    ebitda = fin.ebitda_by_month_df["EBITDA"].to_numpy()
+    net_burn = np.clip(-ebitda[-3:], 0.0, None)  # only count burn (loss)
+    avg_burn = float(net_burn.mean())
 
     if avg_burn == 0:
         runway = np.inf
@@ -163,63 +370,95 @@ INTENTS = {
 
 MONTH_NAME_TO_NUM = {m.lower(): i for i, m in enumerate(["", "January","February","March","April","May","June","July","August","September","October","November","December"])}
 
+MONTH_ABBRS = ("jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec")
+_MONTH_NUM = {abbr: f"{i:02d}" for i, abbr in enumerate(MONTH_ABBRS, 1)}
+NUMBER_WORDS = {"one":1,"two":2,"three":3,"four":4,"five":5,"six":6,"seven":7,"eight":8,"nine":9,"ten":10,"eleven":11,"twelve":12}
+
+# Compiled once at import; these run on every Ask.
+_MONTH_NAMED_RE = re.compile(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+([12][0-9]{3})", re.IGNORECASE)
+_MONTH_ISO_RE = re.compile(r"([12][0-9]{3})-(0[1-9]|1[0-2])")
+_MONTH_FOR_RE = re.compile(r"for\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*", re.IGNORECASE)
+_LAST_N_RE = re.compile(
+    r"last\s+(?P<n>\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s+months?",
+    re.IGNORECASE,
+)
+
 def extract_month_from_text(text: str) -> Optional[str]:
-    text_l = text.lower()
+    # Pure regex + table lookups; the patterns are case-insensitive, so the
+    # text isn't lowercased or copied.
 
-    # Try "June 2025" / "Jun 2025" / "2025-06"
-    m = re.search(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+([12][0-9]{3})", text_l)
+    # Try "June 2025" / "Jun 2025"
+    m = _MONTH_NAMED_RE.search(text)
     if m:
-        mon_txt, year = m.group(1), m.group(2)
-        mon_idx = ["jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec"].index(mon_txt) + 1
-        return f"{int(year):04d}-{mon_idx:02d}"
+        return f"{m.group(2)}-{_MONTH_NUM[m.group(1).lower()]}"
 
     # "YYYY-MM"
-    m2 = re.search(r"([12][0-9]{3})-(0[1-9]|1[0-2])", text_l)
+    m2 = _MONTH_ISO_RE.search(text)
     if m2:
         return m2.group(0)
 
     # "for June" (assume latest year present in data)
-    m3 = re.search(r"for\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*", text_l)
+    m3 = _MONTH_FOR_RE.search(text)
     if m3:
-        mon_txt = m3.group(1)
-        mon_idx = ["jan","feb","mar","apr","may","jun","jul","aug","sep","oct","nov","dec"].index(mon_txt) + 1
         # year will be filled by caller if needed
-        return f"XXXX-{mon_idx:02d}"
+        return f"XXXX-{_MONTH_NUM[m3.group(1).lower()]}"
 
     return None
 
 def parse_last_n_months(text: str) -> Optional[int]:
-    m = re.search(r"last\s+(\d+)\s+months?", text.lower())
-    if m:
-        return int(m.group(1))
-    m2 = re.search(r"last\s+(one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s+months?", text.lower())
-    if m2:
-        mapping = {"one":1,"two":2,"three":3,"four":4,"five":5,"six":6,"seven":7,"eight":8,"nine":9,"ten":10,"eleven":11,"twelve":12}
-        return mapping[m2.group(1)]
-    return None
+    m = _LAST_N_RE.search(text)
+    if not m:
+        return None
+    n = m["n"].lower()
+    return int(n) if n.isdigit() else NUMBER_WORDS[n]
+
+# Every intent keyword in one case-insensitive pattern. The lookahead lets
+# finditer report overlapping hits, so a single pass over the text finds all
+# of them; the named group says which keyword family matched.
+_INTENT_KEYWORD_RE = re.compile(
+    r"(?=(?P<cash_runway>cash runway|\brunway\b)"
+    r"|(?P<revenue>revenue)"
+    r"|(?P<vs_budget>vs|versus|budget)"
+    r"|(?P<gross_margin_trend>gross margin|gm ?%)"
+    r"|(?P<opex_breakdown>opex|operating expenses)"
+    r"|(?P<ebitda_trend>ebitda))",
+    re.IGNORECASE,
+)
+# Highest priority first
+_INTENT_PRIORITY = ("cash_runway", "revenue_vs_budget", "gross_margin_trend", "opex_breakdown", "ebitda_trend")
 
 def classify_intent(text: str) -> str:
-    t = text.lower().strip()
-    # direct keywords
-    if "cash runway" in t or re.search(r"\brunway\b", t):
-        return "cash_runway"
-    if "revenue" in t and ("vs" in t or "versus" in t or "budget" in t):
-        return "revenue_vs_budget"
-    if "gross margin" in t or "gm%" in t or "gm %" in t:
-        return "gross_margin_trend"
-    if "opex" in t or "operating expenses" in t:
-        return "opex_breakdown"
-    if "ebitda" in t:
-        return "ebitda_trend"
-    # fallback
-    return "help"
+    hits = {m.lastgroup for m in _INTENT_KEYWORD_RE.finditer(text)}
+    if "revenue" in hits and "vs_budget" in hits:
+        hits.add("revenue_vs_budget")
+    return next((intent for intent in _INTENT_PRIORITY if intent in hits), "help")
 
 # -----------------------------
 # Charting
 # -----------------------------
 
+# Figures handed back via release_fig are cleared and reused by the next chart.
+_FIG_POOL: List[Figure] = []
+
+def _acquire_fig(figsize: Tuple[float, float]):
+    """Return `(fig, ax)` on a blank figure of `figsize`, reusing a pooled one if any."""
+    try:
+        fig = _FIG_POOL.pop()
+        fig.set_size_inches(figsize)
+    except IndexError:
+        # Bypass pyplot: these figures are never shown, so they need no
+        # figure manager and nothing to plt.close().
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+def release_fig(fig: Figure) -> None:
+    """Give a chart figure back to the pool once its pixels have been saved."""
+    fig.clear()
+    _FIG_POOL.append(fig)
+
 def plot_revenue_vs_budget_bar(actual_usd: float, budget_usd: float, title: str = "Revenue vs Budget"):
-    fig, ax = plt.subplots(figsize=(5,3))
+    fig, ax = _acquire_fig((5,3))
     ax.bar(["Actual", "Budget"], [actual_usd, budget_usd])
     ax.set_ylabel("USD")
     ax.set_title(title)
@@ -227,7 +466,7 @@ def plot_revenue_vs_budget_bar(actual_usd: float, budget_usd: float, title: str
     return fig
 
 def plot_gm_trend_line(df: pd.DataFrame, title: str = "Gross Margin %"):
-    fig, ax = plt.subplots(figsize=(6,3))
+    fig, ax = _acquire_fig((6,3))
     ax.plot(df["month"], df["gm_pct"] * 100, marker='o')
     ax.set_ylabel("GM %")
     ax.set_title(title)
@@ -238,7 +477,7 @@ def plot_gm_trend_line(df: pd.DataFrame, title: str = "Gross Margin %"):
     return fig
 
 def plot_opex_breakdown_bar(df: pd.DataFrame, title: str = "Opex Breakdown"):
-    fig, ax = plt.subplots(figsize=(6,3))
+    fig, ax = _acquire_fig((6,3))
     ax.bar(df["account_category"], df["usd"])
     ax.set_ylabel("USD")
     ax.set_title(title)
@@ -247,9 +486,9 @@ def plot_opex_breakdown_bar(df: pd.DataFrame, title: str = "Opex Breakdown"):
     return fig
 
 def plot_cash_trend(fin: FinanceData, months: int = 6, title: str = "Cash Trend"):
-    last = sorted(fin.cash["month"].unique())[-months:]
-    d = fin.cash[fin.cash["month"].isin(last)].copy()
-    fig, ax = plt.subplots(figsize=(6,3))
+    # Select by month, not by row count: a month may hold several entities' rows
+    d = fin.cash_sorted[fin.cash_sorted["month"].isin(fin.sorted_cash_months[-months:])]
+    fig, ax = _acquire_fig((6,3))
     ax.plot(d["month"], d["cash_usd"], marker='o')
     ax.set_ylabel("USD")
     ax.set_title(title)
@@ -260,7 +499,7 @@ def plot_cash_trend(fin: FinanceData, months: int = 6, title: str = "Cash Trend"
 # Orchestration
 # -----------------------------
 
-def respond(text: str, fin: FinanceData) -> tuple[str, plt.Figure | None]:
+def respond(text: str, fin: FinanceData) -> tuple[str, Figure | None]:
     intent = classify_intent(text)
     t = text.strip()
     fig = None
@@ -273,11 +512,11 @@ def respond(text: str, fin: FinanceData) -> tuple[str, plt.Figure | None]:
             if m and m.startswith("XXXX") and len(m) == 7:
                 mon = m.split("-")[1]
                 # find latest month in data that matches that month number
-                months = sorted(fin.actuals["month"].unique())
+                months = fin.sorted_months
                 candidates = [x for x in months if x.endswith(f"-{mon}")]
                 m = candidates[-1] if candidates else months[-1]
             else:
-                m = latest_month(list(fin.actuals["month"].unique()))
+                m = fin.sorted_months[-1]
         rvb = revenue_vs_budget_usd(fin, m)
         msg = (
             f"Revenue vs Budget for {rvb['month']}:\n"
@@ -290,7 +529,7 @@ def respond(text: str, fin: FinanceData) -> tuple[str, plt.Figure | None]:
 
     if intent == "gross_margin_trend":
         n = parse_last_n_months(t) or 3
-        months = sorted(fin.actuals["month"].unique())[-n:]
+        months = fin.sorted_months[-n:]
         df = gross_margin_pct_trend(fin, months)
         msg_lines = [f"Gross Margin % (last {n} months):"]
         for _, row in df.iterrows():
@@ -303,11 +542,11 @@ def respond(text: str, fin: FinanceData) -> tuple[str, plt.Figure | None]:
         if m is None or m.startswith("XXXX"):
             if m and m.startswith("XXXX") and len(m) == 7:
                 mon = m.split("-")[1]
-                months = sorted(fin.actuals["month"].unique())
+                months = fin.sorted_months
                 candidates = [x for x in months if x.endswith(f"-{mon}")]
                 m = candidates[-1] if candidates else months[-1]
             else:
-                m = latest_month(list(fin.actuals["month"].unique()))
+                m = fin.sorted_months[-1]
         df = opex_breakdown_usd(fin, m)
         if df.empty:
             return f"No Opex data for {m}.", None
@@ -337,7 +576,7 @@ def respond(text: str, fin: FinanceData) -> tuple[str, plt.Figure | None]:
         for _, r in last6.iterrows():
             msg.append(f"• {r['month']}: ${r['EBITDA']:,.0f}")
         # quick line chart
-        fig, ax = plt.subplots(figsize=(6,3))
+        fig, ax = _acquire_fig((6,3))
         ax.plot(last6["month"], last6["EBITDA"], marker='o')
         ax.set_title("EBITDA — last 6 months")
         ax.set_ylabel("USD")
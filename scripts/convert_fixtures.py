@@ -0,0 +1,26 @@
+"""Write Parquet copies of the fixture CSVs.
+
+FinanceData.from_dir reads `<name>.parquet` instead of `<name>.csv` when the
+Parquet file is newer, skipping CSV parsing entirely. Requires pyarrow.
+
+Usage:
+    python -m scripts.convert_fixtures [fixtures_dir]    # from the repo root
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+import pandas as pd
+
+from agent.tools import TABLE_DTYPES
+
+def convert(path: str = "fixtures") -> None:
+    for name, dtype in TABLE_DTYPES.items():
+        df = pd.read_csv(os.path.join(path, f"{name}.csv"), dtype=dtype)
+        out = os.path.join(path, f"{name}.parquet")
+        df.to_parquet(out, engine="pyarrow", index=False)
+        print(f"wrote {out} ({len(df)} rows)")
+
+if __name__ == "__main__":
+    convert(sys.argv[1] if len(sys.argv) > 1 else "fixtures")
@@ -0,0 +1,7 @@
+import pytest
+from agent.tools import FinanceData
+
+@pytest.fixture(scope="session")
+def fin():
+    # Parse the fixture CSVs once for the whole run; tests only read from it.
+    return FinanceData.from_dir("fixtures")